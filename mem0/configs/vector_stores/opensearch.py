@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -11,13 +11,43 @@ class OpenSearchConfig(BaseModel):
     password: Optional[str] = Field(None, description="Password for authentication")
     api_key: Optional[str] = Field(None, description="API key for authentication (if applicable)")
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    engine: str = Field(
+        "nmslib",
+        description="k-NN engine for new indices; 'lucene' and 'faiss' apply filters during the k-NN search",
+    )
+    quantization: Optional[Literal["int8", "fp16"]] = Field(
+        None,
+        description="Scalar-quantize vectors in new indices: 'int8' with the lucene engine, 'fp16' with faiss",
+    )
     verify_certs: bool = Field(False, description="Verify SSL certificates (default False for OpenSearch)")
     use_ssl: bool = Field(False, description="Use SSL for connection (default False for OpenSearch)")
     http_auth: Optional[object] = Field(None, description="HTTP authentication method / AWS SigV4")
     connection_class: Optional[Union[str, Type]] = Field(
         "RequestsHttpConnection", description="Connection class for OpenSearch"
     )
-    pool_maxsize: int = Field(20, description="Maximum number of connections in the pool")
+    pool_maxsize: int = Field(32, description="Maximum number of connections in the pool")
+    max_retries: int = Field(3, description="Maximum number of retries for a failed request")
+    retry_on_timeout: bool = Field(True, description="Retry requests that time out")
+    timeout: int = Field(30, description="Request timeout in seconds")
+    http_compress: bool = Field(True, description="Gzip-compress request bodies sent to the cluster")
+    refresh_interval: Optional[str] = Field(
+        None,
+        description="Refresh interval of new indices, paused during multi-chunk bulk loads and restored after; None "
+        "leaves the index's setting untouched",
+    )
+    bulk_thread_count: int = Field(4, description="Number of threads used to send bulk insert chunks")
+    bulk_chunk_size: int = Field(500, description="Number of documents sent per bulk request")
+    vector_precision: Optional[int] = Field(
+        None,
+        description="Round vector components to this many decimal places before sending them, shrinking request bodies",
+    )
+    client_kwargs: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional keyword arguments passed to the OpenSearch client"
+    )
+    cache_config: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Enable the in-process search/get result cache, e.g. {'max_size': 1024, 'ttl_seconds': 60}",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -28,6 +58,13 @@ class OpenSearchConfig(BaseModel):
 
         return values
 
+    @model_validator(mode="after")
+    def validate_quantization(self) -> "OpenSearchConfig":
+        required_engine = {"int8": "lucene", "fp16": "faiss"}.get(self.quantization)
+        if required_engine and self.engine != required_engine:
+            raise ValueError(f"'{self.quantization}' quantization requires the '{required_engine}' engine")
+        return self
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,53 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Literal, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+
+
+class CachedEmbedding(EmbeddingBase):
+    """Wraps another embedder and reuses embeddings of texts it has already seen.
+
+    Entries are keyed on a digest of the text and memory action and evicted least-recently-used once `max_size`
+    is reached.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        super().__init__(embedder.config)
+        self.embedder = embedder
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, calling the wrapped embedder only on a cache miss.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        # Some providers embed differently per action, so the action is part of the key
+        key = hashlib.blake2b(f"{memory_action}\0{text}".encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        embedding = self.embedder.embed(text, memory_action)
+
+        with self._lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return embedding
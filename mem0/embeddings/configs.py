@@ -9,6 +9,9 @@ class EmbedderConfig(BaseModel):
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache_size: Optional[int] = Field(
+        description="Number of embeddings to keep in an in-process LRU cache; disabled when None", default=None, ge=1
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -20,6 +20,7 @@ from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
     get_update_memory_messages,
 )
+from mem0.embeddings.cache import CachedEmbedding
 from mem0.exceptions import ValidationError as Mem0ValidationError
 from mem0.memory.base import MemoryBase
 from mem0.memory.setup import mem0_dir, setup_config
@@ -180,6 +181,8 @@ class Memory(MemoryBase):
             self.config.embedder.config,
             self.config.vector_store.config,
         )
+        if self.config.embedder.cache_size:
+            self.embedding_model = CachedEmbedding(self.embedding_model, max_size=self.config.embedder.cache_size)
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
@@ -1247,6 +1250,8 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.config,
             self.config.vector_store.config,
         )
+        if self.config.embedder.cache_size:
+            self.embedding_model = CachedEmbedding(self.embedding_model, max_size=self.config.embedder.cache_size)
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
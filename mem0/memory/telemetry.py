@@ -6,6 +6,7 @@ import sys
 from posthog import Posthog
 
 import mem0
+from mem0.embeddings.cache import CachedEmbedding
 from mem0.memory.setup import get_or_create_user_id
 
 MEM0_TELEMETRY = os.environ.get("MEM0_TELEMETRY", "True")
@@ -62,16 +63,21 @@ def capture_event(event_name, memory_instance, additional_data=None):
         else None,
     )
 
+    # Report the provider behind the embedding cache rather than the cache wrapper.
+    embedding_model = memory_instance.embedding_model
+    if isinstance(embedding_model, CachedEmbedding):
+        embedding_model = embedding_model.embedder
+
     event_data = {
         "collection": memory_instance.collection_name,
-        "vector_size": memory_instance.embedding_model.config.embedding_dims,
+        "vector_size": embedding_model.config.embedding_dims,
         "history_store": "sqlite",
         "graph_store": f"{memory_instance.graph.__class__.__module__}.{memory_instance.graph.__class__.__name__}"
         if memory_instance.config.graph_store.config
         else None,
         "vector_store": f"{memory_instance.vector_store.__class__.__module__}.{memory_instance.vector_store.__class__.__name__}",
         "llm": f"{memory_instance.llm.__class__.__module__}.{memory_instance.llm.__class__.__name__}",
-        "embedding_model": f"{memory_instance.embedding_model.__class__.__module__}.{memory_instance.embedding_model.__class__.__name__}",
+        "embedding_model": f"{embedding_model.__class__.__module__}.{embedding_model.__class__.__name__}",
         "function": f"{memory_instance.__class__.__module__}.{memory_instance.__class__.__name__}.{memory_instance.api_version}",
     }
     if additional_data:
@@ -1,12 +1,27 @@
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 try:
-    from opensearchpy import OpenSearch, RequestsHttpConnection
+    from opensearchpy import OpenSearch, RequestsHttpConnection, helpers
+    from opensearchpy.exceptions import ConnectionTimeout, NotFoundError, SerializationError, TransportError
+    from opensearchpy.serializer import JSONSerializer
 except ImportError:
     raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import numpy as np
 from pydantic import BaseModel
 
 from mem0.configs.vector_stores.opensearch import OpenSearchConfig
@@ -14,6 +29,50 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Status codes returned by a throttled cluster; 503 is retried by the transport (its default retry_on_status), which
+# covers every call including bulk writes
+RETRYABLE_STATUS_CODES = (429,)
+RETRY_MAX_TRIES = 5
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 5.0
+
+# Status codes returned for APIs a cluster does not expose or let the caller use
+UNSUPPORTED_API_STATUS_CODES = (400, 403, 404, 405)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Jittered exponential backoff delay before retry number `attempt` (0-based)."""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt) + random.random() * RETRY_BASE_DELAY
+
+
+def _with_retry(fn, *args, **kwargs):
+    """Call `fn`, retrying with jittered exponential backoff when the cluster answers 429."""
+    for attempt in range(RETRY_MAX_TRIES):
+        try:
+            return fn(*args, **kwargs)
+        except TransportError as e:
+            if e.status_code not in RETRYABLE_STATUS_CODES or attempt == RETRY_MAX_TRIES - 1:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"OpenSearch returned {e.status_code}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
+def _invalidates_cache(method):
+    """Clear the store's query cache once `method` has written, including when it raises.
+
+    Clearing after the write also drops results that concurrent reads cached while it was in flight.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_cache()
+
+    return wrapper
+
 
 class OutputData(BaseModel):
     id: str
@@ -21,11 +80,121 @@ class OutputData(BaseModel):
     payload: Dict
 
 
+def _mmr_select(query_vector: List[float], candidates: np.ndarray, limit: int, lambda_mult: float) -> List[int]:
+    """Greedily pick up to `limit` row indices of `candidates` by Maximal Marginal Relevance."""
+    query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+    query = query / (np.linalg.norm(query) or 1.0)
+    norms = np.linalg.norm(candidates, axis=1, keepdims=True)
+    candidates = candidates / np.where(norms == 0, 1.0, norms)
+
+    query_sims = candidates @ query
+    pairwise_sims = candidates @ candidates.T
+
+    selected = [int(np.argmax(query_sims))]
+    # Highest similarity of each candidate to anything selected so far
+    max_selected_sims = pairwise_sims[selected[0]].copy()
+    while len(selected) < min(limit, len(candidates)):
+        scores = lambda_mult * query_sims - (1 - lambda_mult) * max_selected_sims
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        max_selected_sims = np.maximum(max_selected_sims, pairwise_sims[best])
+    return selected
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson, which encodes float lists and NumPy arrays far faster than `json`."""
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data: Any) -> Any:
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(
+                data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a per-entry TTL for search and get results."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped by clear(), so a value read from the cluster before a clear is not stored after it
+        self.generation = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return `(found, value)` for `key`, dropping the entry if it has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expiry, value = entry
+                if expiry > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Tuple, value: Any, generation: Optional[int] = None) -> None:
+        """Store `value`, unless the cache was cleared since `generation` was read."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+
 class OpenSearchDB(VectorStoreBase):
+    # Keyword fields that session filters are matched against
+    _FILTER_FIELDS = {key: f"payload.{key}.keyword" for key in ("user_id", "run_id", "agent_id")}
+
+    # k-NN engines that apply filters while traversing the graph instead of to the top-k afterwards
+    _EFFICIENT_FILTER_ENGINES = ("lucene", "faiss")
+
     def __init__(self, **kwargs):
         config = OpenSearchConfig(**kwargs)
 
-        # Initialize OpenSearch client
+        client_kwargs = dict(config.client_kwargs)
+        client_kwargs.setdefault("pool_maxsize", config.pool_maxsize)
+        client_kwargs.setdefault("max_retries", config.max_retries)
+        client_kwargs.setdefault("retry_on_timeout", config.retry_on_timeout)
+        client_kwargs.setdefault("timeout", config.timeout)
+        client_kwargs.setdefault("http_compress", config.http_compress)
+        client_kwargs.setdefault("serializer", OrjsonSerializer() if orjson is not None else JSONSerializer())
+
+        # Initialize OpenSearch client; RequestsHttpConnection keeps a requests.Session, so sockets are kept alive
+        # and reused across calls
         self.client = OpenSearch(
             hosts=[{"host": config.host, "port": config.port or 9200}],
             http_auth=config.http_auth
@@ -34,13 +203,30 @@ class OpenSearchDB(VectorStoreBase):
             use_ssl=config.use_ssl,
             verify_certs=config.verify_certs,
             connection_class=RequestsHttpConnection,
-            pool_maxsize=20,
+            **client_kwargs,
         )
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.engine = config.engine
+        self.quantization = config.quantization
+        self.refresh_interval = config.refresh_interval
+        self.bulk_thread_count = config.bulk_thread_count
+        self.bulk_chunk_size = config.bulk_chunk_size
+        self.vector_precision = config.vector_precision
+        self._float32_vectors = isinstance(client_kwargs["serializer"], OrjsonSerializer)
+        self._cache = QueryCache(**config.cache_config) if config.cache_config is not None else None
         self.create_col(self.collection_name, self.embedding_model_dims)
 
+    def _knn_method(self, space_type: str) -> Dict[str, Any]:
+        """Build the HNSW method definition for `knn_vector` mappings, with the configured scalar quantization."""
+        method = {"engine": self.engine, "name": "hnsw", "space_type": space_type}
+        if self.quantization == "int8":
+            method["parameters"] = {"encoder": {"name": "sq"}}
+        elif self.quantization == "fp16":
+            method["parameters"] = {"encoder": {"name": "sq", "parameters": {"type": "fp16"}}}
+        return method
+
     def create_index(self) -> None:
         """Create OpenSearch index with proper mappings if it doesn't exist."""
         index_settings = {
@@ -53,7 +239,7 @@ class OpenSearchDB(VectorStoreBase):
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": self.embedding_model_dims,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self._knn_method("cosinesimil"),
                     },
                     "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
                 }
@@ -66,8 +252,14 @@ class OpenSearchDB(VectorStoreBase):
         else:
             logger.info(f"Index {self.collection_name} already exists")
 
-    def create_col(self, name: str, vector_size: int) -> None:
-        """Create a new collection (index in OpenSearch)."""
+    def create_col(self, name: str, vector_size: int, distance: str = "cosinesimil") -> None:
+        """Create a new collection (index in OpenSearch).
+
+        Uses this store's client, so additional collections can be managed without building another store.
+        """
+        if self.client.indices.exists(index=name):
+            return
+
         index_settings = {
             "settings": {"index.knn": True},
             "mappings": {
@@ -75,119 +267,369 @@ class OpenSearchDB(VectorStoreBase):
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": vector_size,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self._knn_method(distance),
                     },
                     "payload": {"type": "object"},
                     "id": {"type": "keyword"},
                 }
             },
         }
+        if self.refresh_interval:
+            index_settings["settings"]["index.refresh_interval"] = self.refresh_interval
+
+        logger.warning(f"Creating index {name}, it might take 1-2 minutes...")
+        self.client.indices.create(index=name, body=index_settings)
+        self._wait_for_index_ready(name)
 
-        if not self.client.indices.exists(index=name):
-            logger.warning(f"Creating index {name}, it might take 1-2 minutes...")
-            self.client.indices.create(index=name, body=index_settings)
-
-            # Wait for index to be ready
-            max_retries = 180  # 3 minutes timeout
-            retry_count = 0
-            while retry_count < max_retries:
-                try:
-                    # Check if index is ready by attempting a simple search
-                    self.client.search(index=name, body={"query": {"match_all": {}}})
-                    time.sleep(1)
-                    logger.info(f"Index {name} is ready")
-                    return
-                except Exception:
-                    retry_count += 1
-                    if retry_count == max_retries:
-                        raise TimeoutError(f"Index {name} creation timed out after {max_retries} seconds")
-                    time.sleep(0.5)
+    def _wait_for_index_ready(self, name: str, timeout: int = 180) -> None:
+        """Block until a newly created index can serve requests.
+
+        The cluster health API waits server-side, so a single request replaces client-side polling. Clusters that
+        do not expose it (e.g. OpenSearch Serverless) fall back to polling with exponential backoff.
+        """
+        try:
+            health = self.client.cluster.health(
+                index=name, wait_for_status="yellow", timeout=f"{timeout}s", request_timeout=timeout + 10
+            )
+        except ConnectionTimeout:
+            raise TimeoutError(f"Index {name} creation timed out after {timeout} seconds") from None
+        except TransportError as e:
+            # The cluster answers 408 when the status was not reached in time
+            if e.status_code == 408:
+                raise TimeoutError(f"Index {name} creation timed out after {timeout} seconds") from None
+            if e.status_code not in UNSUPPORTED_API_STATUS_CODES:
+                raise
+            logger.debug(f"Cluster health API unavailable ({e}), polling index {name} instead")
+        else:
+            if health.get("timed_out"):
+                raise TimeoutError(f"Index {name} creation timed out after {timeout} seconds")
+            logger.info(f"Index {name} is ready")
+            return
+
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while True:
+            try:
+                # Check if index is ready by attempting a simple search
+                self.client.search(index=name, body={"query": {"match_all": {}}})
+                logger.info(f"Index {name} is ready")
+                return
+            except Exception:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Index {name} creation timed out after {timeout} seconds")
+                time.sleep(delay)
+                delay = min(delay * 2, 5.0)
 
     def insert(
         self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
     ) -> List[OutputData]:
         """Insert vectors into the index."""
+        return self.insert_many(vectors, payloads=payloads, ids=ids)
+
+    @_invalidates_cache
+    def insert_many(
+        self,
+        vectors: List[List[float]],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[OutputData]:
+        """Bulk-load vectors, sending one `_bulk` request per `chunk_size` documents.
+
+        Args:
+            vectors (List[List[float]]): Vectors to insert.
+            payloads (List[Dict], optional): Payload for each vector. Defaults to empty payloads.
+            ids (List[str], optional): ID for each vector. Defaults to positional IDs.
+            chunk_size (int, optional): Documents per bulk request. Defaults to `bulk_chunk_size` from the config.
+
+        Returns:
+            List[OutputData]: The inserted entries.
+        """
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
-        results = []
-        for i, (vec, id_) in enumerate(zip(vectors, ids)):
-            body = {
-                "vector_field": vec,
-                "payload": payloads[i],
-                "id": id_,
+        index_name = self.collection_name
+        prepare_vector = self._prepare_vector
+
+        def make_action(vec, payload, id_):
+            return {
+                "_op_type": "index",
+                "_index": index_name,
+                "_source": {"vector_field": prepare_vector(vec), "payload": payload, "id": id_},
             }
-            try:
-                self.client.index(index=self.collection_name, body=body)
-                # Force refresh to make documents immediately searchable for tests
-                self.client.indices.refresh(index=self.collection_name)
-                
-                results.append(OutputData(
-                    id=id_,
-                    score=1.0,  # No score for inserts
-                    payload=payloads[i]
-                ))
-            except Exception as e:
-                logger.error(f"Error inserting vector {id_}: {e}")
-                raise
 
+        # Actions are produced lazily so only the chunks in flight are held in memory
+        actions = (make_action(vec, payload, id_) for vec, payload, id_ in zip(vectors, payloads, ids))
+
+        chunk_size = chunk_size or self.bulk_chunk_size
+        # With a configured refresh interval, loads spanning several bulk requests pause periodic refreshes, so
+        # segments are not flushed between chunks; a single refresh follows below. Without one the index's own
+        # setting is left alone, since the store has no interval of its own to restore
+        pause_refresh = bool(self.refresh_interval) and len(vectors) > chunk_size and self._set_refresh_interval("-1")
+
+        errors = []
+        try:
+            if len(vectors) <= chunk_size:
+                # A single request needs no thread pool
+                errors = self._bulk_with_retry(actions, chunk_size)
+            else:
+                # Bulk chunks are serialized and sent concurrently over the connection pool. Results come back in
+                # input order, so documents the cluster rejected with 429 can be resent afterwards with backoff
+                throttled = []
+                for i, (ok, item) in enumerate(
+                    helpers.parallel_bulk(
+                        self.client,
+                        actions,
+                        thread_count=self.bulk_thread_count,
+                        chunk_size=chunk_size,
+                        queue_size=4,
+                        raise_on_error=False,
+                        raise_on_exception=False,
+                    )
+                ):
+                    if ok:
+                        continue
+                    if next(iter(item.values())).get("status") == 429:
+                        throttled.append(i)
+                    else:
+                        errors.append(item)
+                if throttled:
+                    logger.warning(f"OpenSearch rejected {len(throttled)} document(s) with 429, retrying")
+                    time.sleep(_retry_delay(0))
+                    retry_actions = (make_action(vectors[i], payloads[i], ids[i]) for i in throttled)
+                    errors.extend(self._bulk_with_retry(retry_actions, chunk_size))
+        finally:
+            if pause_refresh:
+                # The configured interval is restored rather than one read back, which an overlapping load may
+                # have already set to -1
+                if not self._set_refresh_interval(self.refresh_interval):
+                    logger.warning(f"Periodic refreshes of index {index_name} are still paused after a bulk load")
+
+        if errors:
+            logger.error(f"Error inserting {len(errors)} vector(s): {errors[0]}")
+            raise helpers.BulkIndexError(f"{len(errors)} document(s) failed to index.", errors)
+
+        # Force refresh to make documents immediately searchable for tests
+        self.client.indices.refresh(index=self.collection_name)
+
+        results = [
+            OutputData(id=id_, score=1.0, payload=payload)  # No score for inserts
+            for id_, payload in zip(ids, payloads)
+        ]
         return results
 
-    def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
-    ) -> List[OutputData]:
-        """Search for similar vectors using OpenSearch k-NN search with optional filters."""
+    def _set_refresh_interval(self, interval: str) -> bool:
+        """Set the index's refresh interval and return whether the cluster allowed it.
+
+        OpenSearch Serverless manages refreshes itself and rejects the setting, in which case loads run unpaused.
+        """
+        try:
+            self.client.indices.put_settings(index=self.collection_name, body={"index": {"refresh_interval": interval}})
+            return True
+        except TransportError as e:
+            logger.debug(f"Could not set refresh_interval of index {self.collection_name} ({e})")
+            return False
+
+    def _bulk_with_retry(self, actions, chunk_size: int) -> List[Dict]:
+        """Send `actions` with the bulk helper and return the failed items.
+
+        Requests and documents rejected with 429 are resent with exponential backoff.
+        """
+        _, errors = helpers.bulk(
+            self.client,
+            actions,
+            chunk_size=chunk_size,
+            max_retries=RETRY_MAX_TRIES - 1,
+            initial_backoff=RETRY_BASE_DELAY,
+            max_backoff=RETRY_MAX_DELAY,
+            raise_on_error=False,
+        )
+        return errors
+
+    def _prepare_vector(self, vector: List[float]) -> List[float]:
+        """Shrink a vector's JSON encoding without losing precision the index keeps.
+
+        With `vector_precision` set, components are rounded to that many decimals. Otherwise, when orjson
+        serializes requests, the vector is sent as a float32 array: `knn_vector` stores float32, and the shortest
+        float32 representation is about half as long as that of a float64.
+        """
+        if self.vector_precision is not None:
+            return np.round(np.asarray(vector, dtype=np.float64), self.vector_precision).tolist()
+        if self._float32_vectors:
+            return np.ascontiguousarray(vector, dtype=np.float32)
+        return vector
+
+    def _build_knn_body(
+        self,
+        vectors: List[float],
+        limit: int,
+        filters: Optional[Dict] = None,
+        k: Optional[int] = None,
+        source: Optional[Union[bool, Dict]] = None,
+    ) -> Dict:
+        """Build the k-NN search body shared by `search` and `batch_search`.
+
+        `k` overrides the number of candidates requested, which defaults to twice `limit`. `source` is the
+        `_source` filter; by default stored vectors are left out of the response.
+        """
+        k = k or limit * 2
 
         # Base KNN query
         knn_query = {
             "knn": {
                 "vector_field": {
-                    "vector": vectors,
-                    "k": limit * 2,
+                    "vector": self._prepare_vector(vectors),
+                    "k": k,
                 }
             }
         }
 
         # Start building the full query
-        query_body = {"size": limit * 2, "query": None}
+        query_body = {"size": k, "query": None, "_source": source or {"excludes": ["vector_field"]}}
 
         # Prepare filter conditions if applicable
-        filter_clauses = []
-        if filters:
-            for key in ["user_id", "run_id", "agent_id"]:
-                value = filters.get(key)
-                if value:
-                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        filter_clauses = self._build_filter_clauses(filters)
 
         # Combine knn with filters if needed
-        if filter_clauses:
+        if filter_clauses and self.engine in self._EFFICIENT_FILTER_ENGINES:
+            # Pre-filter inside the k-NN query so non-matching documents are skipped during the search
+            knn_query["knn"]["vector_field"]["filter"] = {"bool": {"filter": filter_clauses}}
+            query_body["query"] = knn_query
+        elif filter_clauses:
             query_body["query"] = {"bool": {"must": knn_query, "filter": filter_clauses}}
         else:
             query_body["query"] = knn_query
 
+        return query_body
+
+    def _build_filter_clauses(self, filters: Optional[Dict]) -> List[Dict]:
+        """Turn session filters into `term` clauses on their keyword fields."""
+        if not filters:
+            return []
+        return [
+            {"term": {field: filters[key]}} for key, field in self._FILTER_FIELDS.items() if filters.get(key)
+        ]
+
+    def _parse_hits(self, hits: List[Dict], limit: int) -> List[OutputData]:
+        return [
+            OutputData(id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {}))
+            for hit in hits[:limit]  # Ensure we don't exceed limit
+        ]
+
+    def search(
+        self,
+        query: str,
+        vectors: List[float],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        mmr: bool = False,
+        fetch_k: Optional[int] = None,
+        lambda_mult: float = 0.5,
+        include_fields: Optional[List[str]] = None,
+    ) -> List[OutputData]:
+        """Search for similar vectors using OpenSearch k-NN search with optional filters.
+
+        With `mmr=True`, `fetch_k` candidates (default `max(3 * limit, 50)`) are fetched in one request and
+        re-ranked client-side with Maximal Marginal Relevance; `lambda_mult` trades relevance (1.0) for
+        diversity (0.0).
+
+        `include_fields` limits the returned source to the given fields (e.g. `["payload.data",
+        "payload.user_id"]`), which keeps responses small when payloads are large.
+        """
+        if mmr:
+            fetch_k = fetch_k or max(3 * limit, 50)
+
+        if self._cache is not None:
+            cache_key = (
+                "search",
+                self.collection_name,
+                query,
+                hashlib.blake2b(np.asarray(vectors, dtype=np.float32).tobytes(), digest_size=16).digest(),
+                json.dumps(filters, sort_keys=True, default=str) if filters else None,
+                limit,
+                (fetch_k, lambda_mult) if mmr else None,
+                tuple(include_fields) if include_fields else None,
+            )
+            generation = self._cache.generation
+            found, cached = self._cache.get(cache_key)
+            if found:
+                return list(cached)
+
+        # The id is always needed to build results, and MMR needs the candidate vectors
+        source = None
+        if include_fields:
+            source = {"includes": ["id", *include_fields, *(["vector_field"] if mmr else [])]}
+        elif mmr:
+            source = True
+        query_body = self._build_knn_body(vectors, limit, filters, k=fetch_k if mmr else None, source=source)
+
         try:
             # Execute search
-            response = self.client.search(index=self.collection_name, body=query_body)
-
+            response = _with_retry(self.client.search, index=self.collection_name, body=query_body)
             hits = response["hits"]["hits"]
-            results = [
-                OutputData(id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {}))
-                for hit in hits[:limit]  # Ensure we don't exceed limit
-            ]
-            return results
+            if mmr and hits:
+                candidates = np.asarray([hit["_source"]["vector_field"] for hit in hits], dtype=np.float32)
+                hits = [hits[i] for i in _mmr_select(vectors, candidates, limit, lambda_mult)]
+            results = self._parse_hits(hits, limit)
+            if self._cache is not None:
+                self._cache.set(cache_key, results, generation)
+            return list(results)
         except Exception as e:
             logger.error(f"Error during search: {e}")
             return []
 
+    async def asearch(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None, **kwargs
+    ) -> List[OutputData]:
+        """Async variant of `search`; concurrent calls share the client's connection pool."""
+        return await asyncio.to_thread(self.search, query, vectors, limit, filters, **kwargs)
+
+    def batch_search(
+        self, queries: List[Tuple[str, List[float]]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """Run several k-NN searches in a single `_msearch` round-trip.
+
+        Args:
+            queries (List[Tuple[str, List[float]]]): (query, vectors) pairs, as passed to `search`.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Results for each query, in the same order as `queries`.
+        """
+        if not queries:
+            return []
+
+        body = []
+        for _, vectors in queries:
+            body.append({"index": self.collection_name})
+            body.append(self._build_knn_body(vectors, limit, filters))
+
+        try:
+            response = _with_retry(self.client.msearch, body=body)
+        except Exception as e:
+            logger.error(f"Error during batch search: {e}")
+            return [[] for _ in queries]
+
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                logger.error(f"Error during batch search: {item['error']}")
+                results.append([])
+                continue
+            results.append(self._parse_hits(item["hits"]["hits"], limit))
+        return results
+
+    @_invalidates_cache
     def delete(self, vector_id: str) -> None:
         """Delete a vector by custom ID."""
         # First, find the document by custom ID
         search_query = {"query": {"term": {"id": vector_id}}}
 
-        response = self.client.search(index=self.collection_name, body=search_query)
+        response = _with_retry(self.client.search, index=self.collection_name, body=search_query)
         hits = response.get("hits", {}).get("hits", [])
 
         if not hits:
@@ -196,15 +638,15 @@ class OpenSearchDB(VectorStoreBase):
         opensearch_id = hits[0]["_id"]
 
         # Delete using the actual document ID
-        self.client.delete(index=self.collection_name, id=opensearch_id)
+        _with_retry(self.client.delete, index=self.collection_name, id=opensearch_id)
 
+    @_invalidates_cache
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload using the custom 'id' field."""
-
         # First, find the document by custom ID
         search_query = {"query": {"term": {"id": vector_id}}}
 
-        response = self.client.search(index=self.collection_name, body=search_query)
+        response = _with_retry(self.client.search, index=self.collection_name, body=search_query)
         hits = response.get("hits", {}).get("hits", [])
 
         if not hits:
@@ -215,39 +657,83 @@ class OpenSearchDB(VectorStoreBase):
         # Prepare updated fields
         doc = {}
         if vector is not None:
-            doc["vector_field"] = vector
+            doc["vector_field"] = self._prepare_vector(vector)
         if payload is not None:
             doc["payload"] = payload
 
         if doc:
             try:
-                response = self.client.update(index=self.collection_name, id=opensearch_id, body={"doc": doc})
+                response = _with_retry(
+                    self.client.update, index=self.collection_name, id=opensearch_id, body={"doc": doc}
+                )
             except Exception:
                 pass
 
     def get(self, vector_id: str) -> Optional[OutputData]:
         """Retrieve a vector by ID."""
+        if self._cache is not None:
+            cache_key = ("get", self.collection_name, vector_id)
+            generation = self._cache.generation
+            found, cached = self._cache.get(cache_key)
+            if found:
+                return cached
+
         try:
             search_query = {"query": {"term": {"id": vector_id}}}
-            response = self.client.search(index=self.collection_name, body=search_query)
+            response = _with_retry(self.client.search, index=self.collection_name, body=search_query)
 
             hits = response["hits"]["hits"]
 
-            if not hits:
-                return None
-
-            return OutputData(id=hits[0]["_source"].get("id"), score=1.0, payload=hits[0]["_source"].get("payload", {}))
+            result = None
+            if hits:
+                result = OutputData(
+                    id=hits[0]["_source"].get("id"), score=1.0, payload=hits[0]["_source"].get("payload", {})
+                )
+            if self._cache is not None:
+                self._cache.set(cache_key, result, generation)
+            return result
         except Exception as e:
             logger.error(f"Error retrieving vector {vector_id}: {str(e)}")
             return None
 
+    def get_many(self, vector_ids: List[str]) -> List[Optional[OutputData]]:
+        """Retrieve several vectors by ID in a single request.
+
+        Args:
+            vector_ids (List[str]): IDs to fetch.
+
+        Returns:
+            List[Optional[OutputData]]: One entry per requested ID, in order; None where the ID was not found.
+        """
+        if not vector_ids:
+            return []
+
+        # Documents are stored under generated `_id`s, so look them up by the `id` field rather than with `_mget`
+        try:
+            search_query = {"size": len(vector_ids), "query": {"terms": {"id": list(vector_ids)}}}
+            response = _with_retry(self.client.search, index=self.collection_name, body=search_query)
+
+            found = {}
+            for hit in response["hits"]["hits"]:
+                id_ = hit["_source"].get("id")
+                found[id_] = OutputData(id=id_, score=1.0, payload=hit["_source"].get("payload", {}))
+            return [found.get(id_) for id_ in vector_ids]
+        except Exception as e:
+            logger.error(f"Error retrieving vectors {vector_ids}: {str(e)}")
+            return [None for _ in vector_ids]
+
     def list_cols(self) -> List[str]:
         """List all collections (indices)."""
-        return list(self.client.indices.get_alias().keys())
+        return [row["index"] for row in self.client.cat.indices(format="json", h="index")]
 
-    def delete_col(self) -> None:
-        """Delete a collection (index)."""
-        self.client.indices.delete(index=self.collection_name)
+    def delete_col(self, name: Optional[str] = None) -> None:
+        """Delete a collection (index), by default the one this store operates on."""
+        name = name or self.collection_name
+        try:
+            self.client.indices.delete(index=name)
+        finally:
+            if name == self.collection_name:
+                self._invalidate_cache()
 
     def col_info(self, name: str) -> Any:
         """Get information about a collection (index)."""
@@ -258,12 +744,7 @@ class OpenSearchDB(VectorStoreBase):
             """List all memories with optional filters."""
             query: Dict = {"query": {"match_all": {}}}
 
-            filter_clauses = []
-            if filters:
-                for key in ["user_id", "run_id", "agent_id"]:
-                    value = filters.get(key)
-                    if value:
-                        filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+            filter_clauses = self._build_filter_clauses(filters)
 
             if filter_clauses:
                 query["query"] = {"bool": {"filter": filter_clauses}}
@@ -271,7 +752,7 @@ class OpenSearchDB(VectorStoreBase):
             if limit:
                 query["size"] = limit
 
-            response = self.client.search(index=self.collection_name, body=query)
+            response = _with_retry(self.client.search, index=self.collection_name, body=query)
             hits = response["hits"]["hits"]
 
             # Return a flat list, not a nested array
@@ -285,8 +766,20 @@ class OpenSearchDB(VectorStoreBase):
             return []
         
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters of the query cache, or an empty dict if caching is disabled."""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def _invalidate_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
-        self.delete_col()
+        try:
+            self.delete_col()
+        except NotFoundError:
+            # Already deleted elsewhere; create_col below probes and recreates it
+            pass
         self.create_col(self.collection_name, self.embedding_model_dims)
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.cache import CachedEmbedding
+from mem0.embeddings.configs import EmbedderConfig
+
+
+def make_embedder():
+    embedder = Mock()
+    embedder.config = BaseEmbedderConfig(model="test-model", embedding_dims=3)
+    embedder.embed.side_effect = lambda text, memory_action=None: [float(len(text)), 0.0, 1.0]
+    return embedder
+
+
+def test_repeated_text_is_embedded_once():
+    embedder = make_embedder()
+    cached = CachedEmbedding(embedder)
+
+    first = cached.embed("I love programming in Python", "add")
+    second = cached.embed("I love programming in Python", "add")
+
+    assert first == second == [28.0, 0.0, 1.0]
+    embedder.embed.assert_called_once_with("I love programming in Python", "add")
+    assert (cached.hits, cached.misses) == (1, 1)
+    assert cached.config is embedder.config
+
+
+def test_memory_action_is_part_of_the_key():
+    embedder = make_embedder()
+    cached = CachedEmbedding(embedder)
+
+    cached.embed("programming", "add")
+    cached.embed("programming", "search")
+
+    assert embedder.embed.call_count == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    embedder = make_embedder()
+    cached = CachedEmbedding(embedder, max_size=2)
+
+    cached.embed("a", "add")
+    cached.embed("b", "add")
+    cached.embed("a", "add")  # "b" is now the least recently used
+    cached.embed("c", "add")
+    cached.embed("a", "add")
+    cached.embed("b", "add")
+
+    assert [call.args[0] for call in embedder.embed.call_args_list] == ["a", "b", "c", "b"]
+
+
+def test_cache_size_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        CachedEmbedding(make_embedder(), max_size=0)
+    with pytest.raises(ValidationError):
+        EmbedderConfig(provider="openai", cache_size=-1)
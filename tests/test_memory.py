@@ -245,3 +245,49 @@ def test_get_all_handles_flat_list_from_postgres(mock_sqlite, mock_llm_factory,
     assert len(result) == 2
     assert result[0]["memory"] == "Memory 1"
     assert result[1]["memory"] == "Memory 2" 
+
+
+@patch('mem0.memory.main.capture_event')
+@patch('mem0.utils.factory.EmbedderFactory.create')
+@patch('mem0.utils.factory.VectorStoreFactory.create')
+@patch('mem0.utils.factory.LlmFactory.create')
+@patch('mem0.memory.storage.SQLiteManager')
+def test_embedder_cache_size_wraps_embedder(
+    mock_sqlite, mock_llm_factory, mock_vector_factory, mock_embedder_factory, mock_capture_event
+):
+    """
+    Test that embedder.cache_size wraps the embedder in a CachedEmbedding,
+    so repeated add/search texts are embedded once, while telemetry still
+    reports the wrapped provider.
+    """
+    from mem0.embeddings.cache import CachedEmbedding
+    from mem0.memory.main import Memory as MemoryClass
+    from mem0.memory.telemetry import capture_event
+
+    embedder = MagicMock()
+    embedder.embed.return_value = [0.1, 0.2, 0.3]
+    mock_embedder_factory.return_value = embedder
+    mock_vector_store = MagicMock()
+    mock_vector_store.search.return_value = []
+    mock_vector_factory.return_value = mock_vector_store
+    mock_llm_factory.return_value = MagicMock()
+    mock_sqlite.return_value = MagicMock()
+
+    config = MemoryConfig(embedder={"provider": "openai", "config": {}, "cache_size": 16})
+    memory = MemoryClass(config)
+
+    assert isinstance(memory.embedding_model, CachedEmbedding)
+    assert memory.embedding_model.embedder is embedder
+
+    for _ in range(2):
+        memory.add([{"role": "user", "content": "I like sci-fi movies"}], user_id="test", infer=False)
+        memory.search("sci-fi", user_id="test")
+
+    embedded = [call.args[0] for call in embedder.embed.call_args_list]
+    assert embedded == ["I like sci-fi movies", "sci-fi"]
+
+    with patch('mem0.memory.telemetry.AnonymousTelemetry') as mock_telemetry:
+        capture_event("mem0.test", memory)
+
+    event_data = mock_telemetry.return_value.capture_event.call_args.args[1]
+    assert event_data["embedding_model"] == "unittest.mock.MagicMock"
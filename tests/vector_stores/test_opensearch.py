@@ -1,18 +1,27 @@
+import asyncio
+import gzip
+import hashlib
+import json
 import os
 import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
 import dotenv
+import numpy as np
 
 try:
-    from opensearchpy import AWSV4SignerAuth, OpenSearch
+    from opensearchpy import AWSV4SignerAuth, OpenSearch, helpers
+    from opensearchpy.exceptions import NotFoundError, TransportError
+    from opensearchpy.serializer import JSONSerializer
 except ImportError:
     raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
 
 from mem0 import Memory
 from mem0.configs.base import MemoryConfig
-from mem0.vector_stores.opensearch import OpenSearchDB
+from mem0.embeddings.base import EmbeddingBase
+from mem0.memory.main import _safe_deepcopy_config
+from mem0.vector_stores.opensearch import OpenSearchDB, OrjsonSerializer, orjson
 
 
 # Mock classes for testing OpenSearch with AWS authentication
@@ -81,6 +90,45 @@ class MockConnectionClass:
         raise TypeError("cannot pickle connection state")
 
 
+class HashEmbedder(EmbeddingBase):
+    """Deterministic embedder derived from a hash of the text, so Memory tests never call an embedding API."""
+
+    def embed(self, text, memory_action=None):
+        digest = hashlib.blake2b(text.encode("utf-8")).digest()
+        return (np.frombuffer(digest * (1536 // len(digest)), dtype=np.uint8).astype(np.float32) / 255).tolist()
+
+
+# Fixture vectors, generated once and shared by every test
+RNG = np.random.default_rng(0)
+VECS = RNG.standard_normal((16, 1536), dtype=np.float32)
+
+
+def _to_lists(body):
+    """Return a request body with any NumPy vectors in it converted to lists, for comparisons."""
+    return json.loads(json.dumps(body, default=np.ndarray.tolist))
+
+
+def _capture_bulk(sent_actions):
+    """Side effect for a patched `helpers.bulk` that records the actions and reports all of them indexed."""
+
+    def bulk(client, actions, **kwargs):
+        actions = list(actions)
+        sent_actions.extend(actions)
+        return len(actions), []
+
+    return bulk
+
+
+def _bulk_insert(store, n, dim=1536, chunk_size=None):
+    """Bulk-load `n` random vectors into `store` and return their ids."""
+    # Rows of the float32 matrix are passed as-is; the serializer encodes them without building Python lists
+    vectors = RNG.standard_normal((n, dim), dtype=np.float32)
+    ids = [f"test_id_{i}" for i in range(n)]
+    payloads = [{"user_id": "user1", "index": i} for i in range(n)]
+    store.insert_many(vectors, payloads=payloads, ids=ids, chunk_size=chunk_size)
+    return ids
+
+
 class TestOpenSearchDB(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -102,6 +150,9 @@ class TestOpenSearchDB(unittest.TestCase):
         self.client_mock.indices.delete = MagicMock()
         self.client_mock.indices.get_alias = MagicMock()
         self.client_mock.indices.refresh = MagicMock()
+        self.client_mock.cluster = MagicMock()
+        self.client_mock.cat = MagicMock()
+        self.client_mock.cluster.health = MagicMock(return_value={"status": "green", "timed_out": False})
         self.client_mock.get = MagicMock()
         self.client_mock.update = MagicMock()
         self.client_mock.delete = MagicMock()
@@ -144,37 +195,102 @@ class TestOpenSearchDB(unittest.TestCase):
         mappings = create_args["body"]["mappings"]["properties"]
         self.assertEqual(mappings["vector_field"]["type"], "knn_vector")
         self.assertEqual(mappings["vector_field"]["dimension"], 1536)
+        self.assertEqual(mappings["vector_field"]["method"]["engine"], "nmslib")
         self.client_mock.reset_mock()
         self.client_mock.indices.exists.return_value = True
         self.os_db.create_index()
         self.client_mock.indices.create.assert_not_called()
 
-    def test_insert(self):
-        vectors = [[0.1] * 1536, [0.2] * 1536]
+    def test_create_col_with_quantization(self):
+        OpenSearchDB(host="localhost", collection_name="int8_index", engine="lucene", quantization="int8")
+        mappings = self.client_mock.indices.create.call_args[1]["body"]["mappings"]
+        method = mappings["properties"]["vector_field"]["method"]
+        self.assertEqual(method["engine"], "lucene")
+        self.assertEqual(method["parameters"], {"encoder": {"name": "sq"}})
+
+        OpenSearchDB(host="localhost", collection_name="fp16_index", engine="faiss", quantization="fp16")
+        mappings = self.client_mock.indices.create.call_args[1]["body"]["mappings"]
+        method = mappings["properties"]["vector_field"]["method"]
+        self.assertEqual(method["parameters"], {"encoder": {"name": "sq", "parameters": {"type": "fp16"}}})
+
+        # nmslib has no scalar quantization
+        with self.assertRaises(ValueError):
+            OpenSearchDB(host="localhost", collection_name="bad_index", quantization="int8")
+
+    def test_reset_recreates_index(self):
+        self.client_mock.reset_mock()
+        self.client_mock.indices.exists.return_value = False
+        self.os_db.reset()
+        self.client_mock.indices.delete.assert_called_once_with(index="test_collection")
+        self.client_mock.indices.exists.assert_called_once_with(index="test_collection")
+        self.client_mock.indices.create.assert_called_once()
+
+        # reset() also recreates an index that was already deleted elsewhere
+        self.client_mock.reset_mock()
+        self.client_mock.indices.delete.side_effect = NotFoundError(404, "index_not_found_exception", {})
+        self.os_db.reset()
+        self.client_mock.indices.create.assert_called_once()
+
+    def test_create_col_waits_on_cluster_health(self):
+        self.os_db.create_col("new_index", 1536)
+        self.client_mock.indices.create.assert_called_once()
+        self.client_mock.cluster.health.assert_called_once()
+        health_args = self.client_mock.cluster.health.call_args[1]
+        self.assertEqual(health_args["index"], "new_index")
+        self.assertEqual(health_args["wait_for_status"], "yellow")
+        self.client_mock.search.assert_not_called()
+
+        # The cluster answers 408 when the index does not reach yellow in time; that must not fall back to polling
+        self.client_mock.cluster.health.side_effect = TransportError(
+            408, "Request Timeout", {"status": "red", "timed_out": True}
+        )
+        with self.assertRaises(TimeoutError):
+            self.os_db.create_col("slow_index", 1536)
+        self.client_mock.search.assert_not_called()
+
+        # Other errors are not mistaken for a missing health API either
+        self.client_mock.cluster.health.side_effect = TransportError(500, "internal_server_error", {})
+        with self.assertRaises(TransportError):
+            self.os_db.create_col("broken_index", 1536)
+        self.client_mock.search.assert_not_called()
+
+    @patch("mem0.vector_stores.opensearch.time.sleep")
+    def test_create_col_falls_back_to_polling(self, mock_sleep):
+        self.client_mock.cluster.health.side_effect = NotFoundError(404, "Not Found", {})
+        self.client_mock.search.side_effect = [Exception("not ready"), Exception("not ready"), {"hits": {"hits": []}}]
+        self.os_db.create_col("new_index", 1536)
+        self.assertEqual(self.client_mock.search.call_count, 3)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [0.1, 0.2])
+
+    @patch("mem0.vector_stores.opensearch.helpers.parallel_bulk")
+    @patch("mem0.vector_stores.opensearch.helpers.bulk")
+    def test_insert(self, mock_bulk, mock_parallel_bulk):
+        vectors = [VECS[0].tolist(), VECS[1].tolist()]
         payloads = [{"key1": "value1"}, {"key2": "value2"}]
         ids = ["id1", "id2"]
 
-        # Mock the index method
-        self.client_mock.index = MagicMock()
+        sent_actions = []
+        mock_bulk.side_effect = _capture_bulk(sent_actions)
 
         results = self.os_db.insert(vectors=vectors, payloads=payloads, ids=ids)
 
-        # Verify index was called twice (once for each vector)
-        self.assertEqual(self.client_mock.index.call_count, 2)
-
-        # Check first call
-        first_call = self.client_mock.index.call_args_list[0]
-        self.assertEqual(first_call[1]["index"], "test_collection")
-        self.assertEqual(first_call[1]["body"]["vector_field"], vectors[0])
-        self.assertEqual(first_call[1]["body"]["payload"], payloads[0])
-        self.assertEqual(first_call[1]["body"]["id"], ids[0])
-
-        # Check second call
-        second_call = self.client_mock.index.call_args_list[1]
-        self.assertEqual(second_call[1]["index"], "test_collection")
-        self.assertEqual(second_call[1]["body"]["vector_field"], vectors[1])
-        self.assertEqual(second_call[1]["body"]["payload"], payloads[1])
-        self.assertEqual(second_call[1]["body"]["id"], ids[1])
+        # A single chunk is sent through the bulk helper without starting a thread pool
+        mock_bulk.assert_called_once()
+        mock_parallel_bulk.assert_not_called()
+        args, kwargs = mock_bulk.call_args
+        self.assertIs(args[0], self.client_mock)
+        self.assertEqual(kwargs["chunk_size"], 500)
+        self.assertEqual(kwargs["max_retries"], 4)
+        self.client_mock.index.assert_not_called()
+        self.client_mock.indices.refresh.assert_called_once_with(index="test_collection")
+
+        self.assertEqual(len(sent_actions), 2)
+        for action, vec, payload, id_ in zip(sent_actions, vectors, payloads, ids):
+            self.assertEqual(action["_op_type"], "index")
+            self.assertEqual(action["_index"], "test_collection")
+            np.testing.assert_array_equal(action["_source"]["vector_field"], vec)
+            self.assertEqual(action["_source"]["payload"], payload)
+            self.assertEqual(action["_source"]["id"], id_)
 
         # Check results
         self.assertEqual(len(results), 2)
@@ -183,6 +299,139 @@ class TestOpenSearchDB(unittest.TestCase):
         self.assertEqual(results[1].id, "id2")
         self.assertEqual(results[1].payload, payloads[1])
 
+    @patch("mem0.vector_stores.opensearch.helpers.bulk")
+    def test_insert_raises_on_failed_items(self, mock_bulk):
+        mock_bulk.return_value = (1, [{"index": {"status": 400, "error": "mapper_parsing"}}])
+        with self.assertRaises(helpers.BulkIndexError):
+            self.os_db.insert(vectors=[VECS[0].tolist(), VECS[1].tolist()], payloads=[{}, {}], ids=["id1", "id2"])
+        self.client_mock.indices.refresh.assert_not_called()
+
+    @patch("opensearchpy.helpers.actions.time.sleep")
+    def test_insert_retries_throttled_documents(self, mock_sleep):
+        self.client_mock.transport = MagicMock(serializer=JSONSerializer())
+        self.client_mock.bulk.side_effect = [
+            TransportError(429, "too_many_requests", {}),
+            {"errors": True, "items": [{"index": {"status": 201}}, {"index": {"status": 429}}]},
+            {"errors": False, "items": [{"index": {"status": 201}}]},
+        ]
+
+        self.os_db.insert(vectors=[VECS[0].tolist(), VECS[1].tolist()], payloads=[{}, {}], ids=["id1", "id2"])
+
+        # The throttled request is resent whole, then only the rejected document
+        self.assertEqual(self.client_mock.bulk.call_count, 3)
+        last_body = self.client_mock.bulk.call_args[1]["body"]
+        self.assertEqual([json.loads(line)["id"] for line in last_body.splitlines()[1::2]], ["id2"])
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.client_mock.indices.refresh.assert_called_once_with(index="test_collection")
+
+    @patch("mem0.vector_stores.opensearch.time.sleep")
+    def test_insert_many_retries_throttled_documents(self, mock_sleep):
+        self.client_mock.transport = MagicMock(serializer=OrjsonSerializer() if orjson else JSONSerializer())
+        throttled = {"test_id_7"}
+
+        def bulk(body, **kwargs):
+            docs = [json.loads(line) for line in body.splitlines()[1::2]]
+            items = [{"index": {"status": 429 if doc["id"] in throttled else 201}} for doc in docs]
+            throttled.difference_update(doc["id"] for doc in docs)
+            return {"errors": any(item["index"]["status"] == 429 for item in items), "items": items}
+
+        self.client_mock.bulk.side_effect = bulk
+
+        _bulk_insert(self.os_db, 1000, chunk_size=500)
+
+        # Two concurrent chunks, then one request resending the rejected document after a backoff
+        self.assertEqual(self.client_mock.bulk.call_count, 3)
+        last_body = self.client_mock.bulk.call_args[1]["body"]
+        self.assertEqual([json.loads(line)["id"] for line in last_body.splitlines()[1::2]], ["test_id_7"])
+        mock_sleep.assert_called_once()
+
+    def test_insert_many_sends_one_request_per_chunk(self):
+        # Run the real bulk helpers against the mocked client
+        self.client_mock.transport = MagicMock(serializer=OrjsonSerializer() if orjson else JSONSerializer())
+        self.client_mock.bulk.side_effect = lambda body, **kwargs: {
+            "errors": False,
+            "items": [{"index": {"status": 201}} for _ in range(body.count("\n") // 2)],
+        }
+
+        # Without a configured interval the index's own setting is never touched
+        _bulk_insert(self.os_db, 1000, chunk_size=500)
+        self.assertEqual(self.client_mock.bulk.call_count, 2)
+        self.client_mock.indices.put_settings.assert_not_called()
+        self.client_mock.indices.refresh.assert_called_once_with(index="test_collection")
+
+        self.client_mock.reset_mock()
+        self.os_db.refresh_interval = "10s"
+
+        _bulk_insert(self.os_db, 1000, chunk_size=500)
+
+        self.assertEqual(self.client_mock.bulk.call_count, 2)
+        # Periodic refreshes are paused for the load and the configured interval is restored before the single
+        # explicit refresh
+        self.assertEqual(
+            [c[1]["body"] for c in self.client_mock.indices.put_settings.call_args_list],
+            [{"index": {"refresh_interval": "-1"}}, {"index": {"refresh_interval": "10s"}}],
+        )
+        self.client_mock.indices.get_settings.assert_not_called()
+        self.client_mock.indices.refresh.assert_called_once_with(index="test_collection")
+
+        # Clusters that reject the setting, such as OpenSearch Serverless, load without pausing
+        self.client_mock.reset_mock()
+        self.client_mock.indices.put_settings.side_effect = TransportError(400, "illegal_argument_exception", {})
+        _bulk_insert(self.os_db, 1000, chunk_size=500)
+        self.assertEqual(self.client_mock.bulk.call_count, 2)
+        self.client_mock.indices.put_settings.assert_called_once()
+        self.client_mock.indices.refresh.assert_called_once_with(index="test_collection")
+        self.client_mock.index.assert_not_called()
+        sent_ids = [
+            json.loads(line)["id"]
+            for call in self.client_mock.bulk.call_args_list
+            for line in call[1]["body"].splitlines()[1::2]
+        ]
+        self.assertEqual(sorted(sent_ids), sorted(f"test_id_{i}" for i in range(1000)))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_vectors_are_sent_as_float32(self):
+        serializer = OrjsonSerializer()
+        vector = VECS[0].astype(np.float64).tolist()
+        sent = serializer.dumps(self.os_db._prepare_vector(vector))
+
+        # The shortest float32 representation round-trips exactly and is far shorter than the float64 one
+        np.testing.assert_array_equal(np.asarray(json.loads(sent), dtype=np.float32), VECS[0])
+        self.assertLess(len(sent), 0.6 * len(serializer.dumps(vector)))
+
+    def test_bulk_bodies_are_gzip_compressed(self):
+        # Send through a real client built with the store's own connection settings, stopping at the socket
+        sent = []
+
+        def send(request, **kwargs):
+            sent.append(request)
+            response = {"errors": False, "items": [{"index": {"status": 201}}] * 100}
+            return MagicMock(status_code=200, headers={}, content=json.dumps(response).encode())
+
+        client_kwargs = {**self.mock_os.call_args[1], "hosts": [{"host": "localhost", "port": 9200}]}
+        self.os_db.client = OpenSearch(**client_kwargs)
+        with patch("requests.Session.send", side_effect=send):
+            _bulk_insert(self.os_db, 100)
+
+        bulk = sent[0]
+        self.assertTrue(bulk.path_url.startswith("/_bulk"))
+        self.assertEqual(bulk.headers["content-encoding"], "gzip")
+        raw = gzip.decompress(bulk.body)
+        self.assertEqual(raw.count(b"\n"), 200)
+        self.assertLess(len(bulk.body), len(raw) / 2)
+
+    @patch("mem0.vector_stores.opensearch.helpers.bulk")
+    def test_insert_with_vector_precision(self, mock_bulk):
+        sent_actions = []
+        mock_bulk.side_effect = _capture_bulk(sent_actions)
+        self.os_db.vector_precision = 4
+
+        self.os_db.insert(vectors=[[0.123456789, -0.987654321]], payloads=[{}], ids=["id1"])
+        self.assertEqual(sent_actions[0]["_source"]["vector_field"], [0.1235, -0.9877])
+
+        body = self.os_db._build_knn_body([0.123456789, -0.987654321], limit=5)
+        self.assertEqual(body["query"]["knn"]["vector_field"]["vector"], [0.1235, -0.9877])
+
     def test_get(self):
         mock_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1", "payload": {"key1": "value1"}}}]}}
         self.client_mock.search.return_value = mock_response
@@ -199,8 +448,29 @@ class TestOpenSearchDB(unittest.TestCase):
         result = self.os_db.get("nonexistent")
         self.assertIsNone(result)
 
+    def test_get_many(self):
+        self.client_mock.search.return_value = {
+            "hits": {
+                "hits": [
+                    {"_id": "doc3", "_source": {"id": "id3", "payload": {"key3": "value3"}}},
+                    {"_id": "doc1", "_source": {"id": "id1", "payload": {"key1": "value1"}}},
+                ]
+            }
+        }
+        results = self.os_db.get_many(["id1", "id2", "id3"])
+
+        self.client_mock.search.assert_called_once()
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body, {"size": 3, "query": {"terms": {"id": ["id1", "id2", "id3"]}}})
+        self.assertEqual([r.id if r else None for r in results], ["id1", None, "id3"])
+        self.assertEqual(results[2].payload, {"key3": "value3"})
+
+        self.client_mock.search.reset_mock()
+        self.assertEqual(self.os_db.get_many([]), [])
+        self.client_mock.search.assert_not_called()
+
     def test_update(self):
-        vector = [0.3] * 1536
+        vector = VECS[2].tolist()
         payload = {"key3": "value3"}
         mock_search_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1"}}]}}
         self.client_mock.search.return_value = mock_search_response
@@ -209,13 +479,32 @@ class TestOpenSearchDB(unittest.TestCase):
         update_args = self.client_mock.update.call_args[1]
         self.assertEqual(update_args["index"], "test_collection")
         self.assertEqual(update_args["id"], "doc1")
-        self.assertEqual(update_args["body"], {"doc": {"vector_field": vector, "payload": payload}})
+        self.assertEqual(_to_lists(update_args["body"]), {"doc": {"vector_field": vector, "payload": payload}})
 
     def test_list_cols(self):
-        self.client_mock.indices.get_alias.return_value = {"test_collection": {}}
+        self.client_mock.cat.indices.return_value = [{"index": "test_collection"}, {"index": "other_collection"}]
         result = self.os_db.list_cols()
-        self.client_mock.indices.get_alias.assert_called_once()
-        self.assertEqual(result, ["test_collection"])
+        self.client_mock.cat.indices.assert_called_once_with(format="json", h="index")
+        self.client_mock.indices.get_alias.assert_not_called()
+        self.assertEqual(result, ["test_collection", "other_collection"])
+
+    def test_list_with_filters(self):
+        self.client_mock.search.return_value = {"hits": {"hits": [{"_source": {"id": "id1", "payload": {}}}]}}
+        results = self.os_db.list(filters={"user_id": "alice", "agent_id": "bot", "run_id": None}, limit=10)
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(
+            body["query"],
+            {
+                "bool": {
+                    "filter": [
+                        {"term": {"payload.user_id.keyword": "alice"}},
+                        {"term": {"payload.agent_id.keyword": "bot"}},
+                    ]
+                }
+            },
+        )
+        self.assertEqual(body["size"], 10)
+        self.assertEqual(results[0][0].id, "id1")
 
     def test_search(self):
         mock_response = {
@@ -224,13 +513,13 @@ class TestOpenSearchDB(unittest.TestCase):
                     {
                         "_id": "id1",
                         "_score": 0.8,
-                        "_source": {"vector_field": [0.1] * 1536, "id": "id1", "payload": {"key1": "value1"}},
+                        "_source": {"vector_field": VECS[0].tolist(), "id": "id1", "payload": {"key1": "value1"}},
                     }
                 ]
             }
         }
         self.client_mock.search.return_value = mock_response
-        vectors = [[0.1] * 1536]
+        vectors = VECS[0].tolist()
         results = self.os_db.search(query="", vectors=vectors, limit=5)
         self.client_mock.search.assert_called_once()
         search_args = self.client_mock.search.call_args[1]
@@ -238,13 +527,265 @@ class TestOpenSearchDB(unittest.TestCase):
         body = search_args["body"]
         self.assertIn("knn", body["query"])
         self.assertIn("vector_field", body["query"]["knn"])
-        self.assertEqual(body["query"]["knn"]["vector_field"]["vector"], vectors)
+        np.testing.assert_array_equal(body["query"]["knn"]["vector_field"]["vector"], vectors)
         self.assertEqual(body["query"]["knn"]["vector_field"]["k"], 10)
+        self.assertEqual(body["_source"], {"excludes": ["vector_field"]})
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].id, "id1")
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_with_filters(self):
+        self.client_mock.search.return_value = {
+            "hits": {
+                "hits": [
+                    {"_score": 0.9, "_source": {"id": "id1", "payload": {"user_id": "user1"}}},
+                    {"_score": 0.8, "_source": {"id": "id2", "payload": {"user_id": "user1"}}},
+                ]
+            }
+        }
+        term = {"term": {"payload.user_id.keyword": "user1"}}
+
+        # nmslib cannot filter during the search, so the filter wraps the k-NN query
+        self.os_db.search(query="", vectors=VECS[0].tolist(), limit=5, filters={"user_id": "user1"})
+        query = self.client_mock.search.call_args[1]["body"]["query"]
+        self.assertEqual(query["bool"]["filter"], [term])
+        self.assertNotIn("filter", query["bool"]["must"]["knn"]["vector_field"])
+
+        with patch.object(self.os_db, "engine", "lucene"):
+            results = self.os_db.search(query="", vectors=VECS[0].tolist(), limit=5, filters={"user_id": "user1"})
+        query = self.client_mock.search.call_args[1]["body"]["query"]
+        self.assertEqual(query["knn"]["vector_field"]["filter"], {"bool": {"filter": [term]}})
+        self.assertTrue(all(r.payload["user_id"] == "user1" for r in results))
+
+    def test_search_with_include_fields(self):
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_score": 0.8, "_source": {"id": "id1", "payload": {"data": "likes tea"}}}]}
+        }
+        results = self.os_db.search(query="", vectors=VECS[0].tolist(), limit=5, include_fields=["payload.data"])
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["_source"], {"includes": ["id", "payload.data"]})
+        self.assertEqual(results[0].payload, {"data": "likes tea"})
+
+    def test_search_with_mmr(self):
+        hits = [
+            {"_score": 0.99, "_source": {"vector_field": [1.0, 0.0], "id": "a", "payload": {}}},
+            {"_score": 0.98, "_source": {"vector_field": [0.99, 0.01], "id": "a_duplicate", "payload": {}}},
+            {"_score": 0.70, "_source": {"vector_field": [0.7, 0.7], "id": "b", "payload": {}}},
+        ]
+        self.client_mock.search.return_value = {"hits": {"hits": hits}}
+
+        results = self.os_db.search(query="", vectors=[1.0, 0.0], limit=2, mmr=True, lambda_mult=0.3)
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["size"], 50)
+        self.assertEqual(body["query"]["knn"]["vector_field"]["k"], 50)
+        self.assertIs(body["_source"], True)
+        self.assertEqual([r.id for r in results], ["a", "b"])
+        self.assertEqual(results[1].score, 0.70)
+
+        # Pure relevance keeps the near-duplicate
+        results = self.os_db.search(query="", vectors=[1.0, 0.0], limit=2, mmr=True, fetch_k=3, lambda_mult=1.0)
+        self.assertEqual(self.client_mock.search.call_args[1]["body"]["size"], 3)
+        self.assertEqual([r.id for r in results], ["a", "a_duplicate"])
+
+    def test_concurrent_searches(self):
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_score": 0.8, "_source": {"id": "id1", "payload": {"user_id": "user1"}}}]}
+        }
+
+        async def run_searches():
+            return await asyncio.gather(
+                *[self.os_db.asearch(query="", vectors=VECS[0].tolist(), limit=5) for _ in range(32)]
+            )
+
+        results = asyncio.run(run_searches())
+        self.assertEqual(len(results), 32)
+        self.assertTrue(all(r[0].id == "id1" for r in results))
+        self.assertEqual(self.client_mock.search.call_count, 32)
+
+    def test_batch_search(self):
+        self.client_mock.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": [{"_id": "doc1", "_score": 0.9, "_source": {"id": "id1", "payload": {"k": "a"}}}]}},
+                {"error": {"type": "search_phase_execution_exception"}},
+            ]
+        }
+        queries = [("first", VECS[0].tolist()), ("second", VECS[1].tolist())]
+        results = self.os_db.batch_search(queries, limit=3, filters={"user_id": "alice"})
+
+        self.client_mock.msearch.assert_called_once()
+        self.client_mock.search.assert_not_called()
+        body = self.client_mock.msearch.call_args[1]["body"]
+        self.assertEqual(len(body), 4)
+        self.assertEqual(body[0], {"index": "test_collection"})
+        self.assertEqual(
+            _to_lists(body[1]), _to_lists(self.os_db._build_knn_body(VECS[0].tolist(), 3, {"user_id": "alice"}))
+        )
+        np.testing.assert_array_equal(body[3]["query"]["bool"]["must"]["knn"]["vector_field"]["vector"], VECS[1])
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0].id, "id1")
+        self.assertEqual(results[0][0].score, 0.9)
+        self.assertEqual(results[1], [])
+
+    def test_batch_search_matches_single_searches(self):
+        # Score the fixture vectors against the query vector in the request body, as the cluster would
+        def execute(body):
+            knn = body["query"]["bool"]["must"] if "bool" in body["query"] else body["query"]
+            scores = VECS @ np.asarray(knn["knn"]["vector_field"]["vector"], dtype=np.float32)
+            order = np.argsort(-scores)[: body["size"]]
+            hits = [{"_id": f"doc{i}", "_score": float(scores[i]), "_source": {"id": f"id{i}"}} for i in order]
+            return {"hits": {"hits": hits}}
+
+        self.client_mock.search.side_effect = lambda index, body: execute(body)
+        self.client_mock.msearch.side_effect = lambda body: {"responses": [execute(b) for b in body[1::2]]}
+        queries = [(f"query {i}", (VECS[i] + 0.1 * VECS[(i + 1) % 16]).tolist()) for i in range(16)]
+
+        batched = self.os_db.batch_search(queries, limit=1, filters={"user_id": "alice"})
+        single = [self.os_db.search(q, v, limit=1, filters={"user_id": "alice"}) for q, v in queries]
+
+        self.client_mock.msearch.assert_called_once()
+        self.assertEqual(batched, single)
+        self.assertEqual([r[0].id for r in batched], [f"id{i}" for i in range(16)])
+
+    def test_batch_apis_issue_one_request(self):
+        # Count the HTTP requests a real client sends, so per-item calls in the batch paths show up as N+1
+        def perform_request(method, url, params=None, body=None, **kwargs):
+            if url == "/_bulk":
+                return {"errors": False, "items": [{"index": {"status": 201}} for _ in range(body.count("\n") // 2)]}
+            if url.endswith("/_msearch"):
+                return {"responses": [{"hits": {"hits": []}} for _ in range(body.count("\n") // 2)]}
+            return {"hits": {"hits": []}}
+
+        self.os_db.client = OpenSearch(hosts=[{"host": "localhost", "port": 9200}], http_compress=False)
+        with patch.object(self.os_db.client.transport, "perform_request", side_effect=perform_request) as spy:
+            _bulk_insert(self.os_db, 100)
+            self.assertEqual([c[0][1] for c in spy.call_args_list], ["/_bulk", "/test_collection/_refresh"])
+
+            spy.reset_mock()
+            self.os_db.get_many([f"test_id_{i}" for i in range(100)])
+            self.os_db.batch_search([("q", VECS[i].tolist()) for i in range(16)], limit=1)
+            self.assertEqual([c[0][1] for c in spy.call_args_list], ["/test_collection/_search", "/_msearch"])
+
+    @patch("mem0.vector_stores.opensearch.helpers.bulk", return_value=(1, []))
+    def test_query_cache(self, mock_bulk):
+        os_db = OpenSearchDB(
+            host="localhost",
+            collection_name="test_collection",
+            embedding_model_dims=1536,
+            cache_config={"max_size": 1, "ttl_seconds": 60},
+        )
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_id": "doc1", "_score": 0.8, "_source": {"id": "id1", "payload": {"k": "v"}}}]}
+        }
+        self.client_mock.search.reset_mock()
+
+        first = os_db.search(query="q", vectors=VECS[0].tolist(), limit=5, filters={"user_id": "alice"})
+        second = os_db.search(query="q", vectors=VECS[0].tolist(), limit=5, filters={"user_id": "alice"})
+        self.assertEqual(self.client_mock.search.call_count, 1)
+        self.assertEqual(first, second)
+
+        # A different key evicts the single cached entry
+        os_db.get("id1")
+        os_db.get("id1")
+        self.assertEqual(self.client_mock.search.call_count, 2)
+        self.assertEqual(os_db.get_cache_stats(), {"hits": 2, "misses": 2, "evictions": 1, "size": 1})
+
+        # Writes invalidate the cache
+        os_db.insert(vectors=[VECS[0].tolist()], payloads=[{}], ids=["id2"])
+        os_db.get("id1")
+        self.assertEqual(self.client_mock.search.call_count, 3)
+
+        self.assertEqual(self.os_db.get_cache_stats(), {})
+
+        # A cache that could hold no entries is rejected up front instead of failing every search
+        with self.assertRaises(ValueError):
+            OpenSearchDB(host="localhost", collection_name="test_collection", cache_config={"max_size": -1})
+
+    @patch("mem0.vector_stores.opensearch.helpers.bulk")
+    def test_query_cache_drops_reads_overlapping_writes(self, mock_bulk):
+        os_db = OpenSearchDB(host="localhost", collection_name="test_collection", cache_config={})
+        stale = {"hits": {"hits": [{"_id": "doc1", "_score": 0.8, "_source": {"id": "id1", "payload": {}}}]}}
+        fresh = {"hits": {"hits": [{"_id": "doc2", "_score": 0.9, "_source": {"id": "id2", "payload": {}}}]}}
+        self.client_mock.search.return_value = stale
+
+        def search(vector=VECS[0]):
+            return os_db.search(query="q", vectors=vector.tolist(), limit=5)
+
+        # A search that runs while the bulk request is in flight sees, and caches, the pre-write results
+        def bulk_with_concurrent_search(client, actions, **kwargs):
+            self.assertEqual(search()[0].id, "id1")
+            return len(list(actions)), []
+
+        mock_bulk.side_effect = bulk_with_concurrent_search
+        os_db.insert(vectors=[VECS[1].tolist()], payloads=[{}], ids=["id2"])
+        self.client_mock.search.return_value = fresh
+        self.assertEqual(search()[0].id, "id2")
+
+        # A search whose request overlaps a completed write does not cache what it read
+        mock_bulk.side_effect = None
+        mock_bulk.return_value = (1, [])
+
+        def search_overlapping_write(index, body):
+            os_db.insert(vectors=[VECS[2].tolist()], payloads=[{}], ids=["id3"])
+            return stale
+
+        self.client_mock.search.side_effect = search_overlapping_write
+        self.assertEqual(search(VECS[3])[0].id, "id1")
+        self.client_mock.search.side_effect = None
+        self.assertEqual(search(VECS[3])[0].id, "id2")
+
+    @patch("mem0.vector_stores.opensearch.time.sleep")
+    def test_search_retries_on_throttling(self, mock_sleep):
+        response = {"hits": {"hits": [{"_id": "doc1", "_score": 0.8, "_source": {"id": "id1", "payload": {}}}]}}
+        self.client_mock.search.side_effect = [
+            TransportError(429, "Too Many Requests", {}),
+            TransportError(429, "Too Many Requests", {}),
+            response,
+        ]
+        results = self.os_db.search(query="", vectors=VECS[0].tolist(), limit=5)
+        self.assertEqual(self.client_mock.search.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(results[0].id, "id1")
+
+        # Non-retryable errors surface immediately
+        self.client_mock.search.reset_mock()
+        self.client_mock.search.side_effect = TransportError(400, "Bad Request", {})
+        self.assertEqual(self.os_db.search(query="", vectors=VECS[0].tolist(), limit=5), [])
+        self.assertEqual(self.client_mock.search.call_count, 1)
+
+        # The read paths behind Memory.get/update/delete and get_all are retried too
+        for read in (lambda: self.os_db.get("id1").id, lambda: self.os_db.list()[0][0].id):
+            self.client_mock.search.reset_mock()
+            self.client_mock.search.side_effect = [TransportError(429, "Too Many Requests", {}), response]
+            self.assertEqual(read(), "id1")
+            self.assertEqual(self.client_mock.search.call_count, 2)
+
+    def test_insert_retries_unavailable_cluster(self):
+        # A real client, so its transport handles the responses of the mocked connection
+        bulk_response = json.dumps({"errors": False, "items": [{"index": {"status": 201}}]})
+        responses = {"_bulk": [TransportError(503, "Service Unavailable", {}), (200, {}, bulk_response)]}
+
+        def perform_request(method, url, *args, **kwargs):
+            endpoint = url.rsplit("/", 1)[-1]
+            if endpoint in responses and responses[endpoint]:
+                response = responses[endpoint].pop(0)
+                if isinstance(response, Exception):
+                    raise response
+                return response
+            return 200, {}, "{}"
+
+        with patch("mem0.vector_stores.opensearch.OpenSearch", OpenSearch):
+            with patch("opensearchpy.RequestsHttpConnection.perform_request", side_effect=perform_request) as mock:
+                os_db = OpenSearchDB(
+                    host="localhost", port=9200, collection_name="test_collection", embedding_model_dims=2
+                )
+                os_db.insert(vectors=[[0.1, 0.2]], payloads=[{}], ids=["id1"])
+
+        # The 503 is retried by the transport, so the write succeeds
+        bulk_calls = [c for c in mock.call_args_list if c.args[1].endswith("/_bulk")]
+        self.assertEqual(len(bulk_calls), 2)
+
     def test_delete(self):
         mock_search_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1"}}]}}
         self.client_mock.search.return_value = mock_search_response
@@ -255,6 +796,46 @@ class TestOpenSearchDB(unittest.TestCase):
         self.os_db.delete_col()
         self.client_mock.indices.delete.assert_called_once_with(index="test_collection")
 
+    def test_create_and_delete_other_collection(self):
+        self.os_db.create_col("temp_collection", 768, "l2")
+        create_args = self.client_mock.indices.create.call_args[1]
+        self.assertEqual(create_args["index"], "temp_collection")
+        vector_field = create_args["body"]["mappings"]["properties"]["vector_field"]
+        self.assertEqual(vector_field["dimension"], 768)
+        self.assertEqual(vector_field["method"]["space_type"], "l2")
+
+        self.os_db.delete_col("temp_collection")
+        self.client_mock.indices.delete.assert_called_once_with(index="temp_collection")
+
+    @patch("mem0.memory.main.capture_event")
+    @patch("mem0.memory.main.SQLiteManager")
+    @patch("mem0.utils.factory.LlmFactory.create")
+    @patch("mem0.utils.factory.EmbedderFactory.create", return_value=HashEmbedder())
+    @patch("mem0.vector_stores.opensearch.helpers.bulk")
+    def test_memory_with_opensearch(self, mock_bulk, *mocks):
+        sent_actions = []
+        mock_bulk.side_effect = _capture_bulk(sent_actions)
+        config = MemoryConfig(
+            vector_store={"provider": "opensearch", "config": {"host": "localhost", "collection_name": "mem0_test"}}
+        )
+        memory = Memory(config)
+        self.assertIsInstance(memory.vector_store, OpenSearchDB)
+
+        # Without inference each message is embedded and stored as-is, so only the vector store path is exercised
+        added = memory.add([{"role": "user", "content": "I love sci-fi movies"}], user_id="alice", infer=False)
+        self.assertEqual(len(sent_actions), 1)
+        source = sent_actions[0]["_source"]
+        np.testing.assert_array_equal(source["vector_field"], HashEmbedder().embed("I love sci-fi movies"))
+        self.assertEqual(source["payload"]["user_id"], "alice")
+
+        self.client_mock.search.return_value = {"hits": {"hits": [{"_id": "doc1", "_score": 0.9, "_source": source}]}}
+        query = "What movies does alice like?"
+        results = memory.search(query, user_id="alice")
+        knn = self.client_mock.search.call_args[1]["body"]["query"]["bool"]["must"]["knn"]
+        np.testing.assert_array_equal(knn["vector_field"]["vector"], HashEmbedder().embed(query))
+        self.assertEqual([r["id"] for r in results["results"]], [added["results"][0]["id"]])
+        self.assertEqual(results["results"][0]["memory"], "I love sci-fi movies")
+
     def test_init_with_http_auth(self):
         mock_credentials = MagicMock()
         mock_signer = AWSV4SignerAuth(mock_credentials, "us-east-1", "es")
@@ -277,9 +858,43 @@ class TestOpenSearchDB(unittest.TestCase):
                 use_ssl=True,
                 verify_certs=True,
                 connection_class=unittest.mock.ANY,
-                pool_maxsize=20,
+                pool_maxsize=32,
+                max_retries=3,
+                retry_on_timeout=True,
+                timeout=30,
+                http_compress=True,
+                serializer=unittest.mock.ANY,
+            )
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_serializer(self):
+        serializer = OrjsonSerializer()
+        body = {"vector_field": np.array([0.5, 0.25], dtype=np.float32), "payload": {"user_id": "alice"}, "id": "id1"}
+        encoded = serializer.dumps(body)
+        self.assertEqual(
+            serializer.loads(encoded), {"vector_field": [0.5, 0.25], "payload": {"user_id": "alice"}, "id": "id1"}
+        )
+        self.assertEqual(serializer.dumps('{"already": "encoded"}'), '{"already": "encoded"}')
+
+    def test_init_with_client_kwargs(self):
+        with patch("mem0.vector_stores.opensearch.OpenSearch") as mock_opensearch:
+            OpenSearchDB(
+                host="localhost",
+                collection_name="test_collection",
+                pool_maxsize=64,
+                timeout=10,
+                http_compress=False,
+                client_kwargs={"max_retries": 5, "pool_block": False},
             )
 
+            kwargs = mock_opensearch.call_args[1]
+            self.assertEqual(kwargs["pool_maxsize"], 64)
+            self.assertEqual(kwargs["timeout"], 10)
+            self.assertEqual(kwargs["max_retries"], 5)
+            self.assertTrue(kwargs["retry_on_timeout"])
+            self.assertFalse(kwargs["http_compress"])
+            self.assertFalse(kwargs["pool_block"])
+
 
 # Tests for OpenSearch config deepcopy with AWS authentication (Issue #3464)
 @patch('mem0.utils.factory.EmbedderFactory.create')
@@ -294,8 +909,6 @@ def test_safe_deepcopy_config_handles_opensearch_auth(mock_sqlite, mock_llm_fact
     mock_llm_factory.return_value = MagicMock()
     mock_sqlite.return_value = MagicMock()
 
-    from mem0.memory.main import _safe_deepcopy_config
-    
     config_with_auth = MockOpenSearchConfig(collection_name="opensearch_test", include_auth=True)
     
     safe_config = _safe_deepcopy_config(config_with_auth)
@@ -325,8 +938,6 @@ def test_safe_deepcopy_config_normal_configs(mock_sqlite, mock_llm_factory, mock
     mock_llm_factory.return_value = MagicMock()
     mock_sqlite.return_value = MagicMock()
 
-    from mem0.memory.main import _safe_deepcopy_config
-    
     config_without_auth = MockOpenSearchConfig(collection_name="normal_test", include_auth=False)
     
     safe_config = _safe_deepcopy_config(config_without_auth)
@@ -131,7 +131,6 @@ def test_list_vectors(upstash_instance):
     handler.fetch_next.side_effect = [mock_result[1:2], mock_result[2:3], []]
 
     filters = {"age": 30, "name": "John"}
-    print("filters", filters)
     [results] = upstash_instance.list(filters=filters, limit=15)
 
     upstash_instance.client.info.return_value = {